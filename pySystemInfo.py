@@ -6,7 +6,7 @@
 #                                                                               #
 #  Kevin Scott (C) 2020-2021                                                    #
 #                                                                               #
-#  NB : Needs psutil & pyinputplus, not in the Python Standard Library.         #
+#  NB : Needs psutil, not in the Python Standard Library.                       #
 #       run py -m pip install -r requirements.txt from a virtual environment.   #
 #                                                                               #
 #  See history.txt for version information.                                     #
@@ -28,136 +28,266 @@
 #                                                                               #
 #################################################################################
 
+import os
 import sys
-import textwrap
-import argparse
-import systemInfo
-import pyinputplus as pyip
+import operator
 
 from _version import __version__
 
 
-SI = systemInfo.SysInfo()
+#  systemInfo [and so psutil] is only imported once the information is needed, see loadSysInfo.
+SI = None
+
+SEPERATOR = "=" * 30
+
+#  Development only, set PYSYSINFO_PROFILE=1 to also print how long each property takes to read.
+PROFILE = os.environ.get("PYSYSINFO_PROFILE") == "1"
+
+DESCRIPTION = """System and hardware Information from Python.
+-----------------------
+Prints a lot of stuff about the Platform, CPU and Network."""
+
+EPILOG = """ If no information is asked for, a Menu will be displayed.
+
+        Kevin Scott (C) 2020-2021"""
+
+#  (label, SysInfo attribute) for the sections that are a plain list of values.
+PLATFORM_FIELDS = [(label, operator.attrgetter(attr)) for label, attr in (
+    ("System",       "System"),
+    ("Hostname",     "Hostname"),
+    ("Release",      "Release"),
+    ("Version",      "Version"),
+    ("Machine",      "Machine"),
+    ("Processor",    "Processor"),
+    ("Architecture", "Architecture"),
+    ("IP Address",   "IPaddress"),
+    ("MAC address",  "MACaddress"))]
+
+MEMORY_FIELDS = [(label, operator.attrgetter(attr)) for label, attr in (
+    ("Total Memory",      "TotalMemory"),
+    ("Available Memory",  "AvailableMemory"),
+    ("Used Memory",       "UsedMemory"),
+    ("Percentage Memory", "PercentageMemory"),
+    ("Total Swap",        "TotalSwap"),
+    ("Free Swap",         "AvailableSwap"),
+    ("Used Swap",         "UsedSwap"),
+    ("Percentage Swap",   "PercentageSwap"))]
+
+PYTHON_FIELDS = [(label, operator.attrgetter(attr)) for label, attr in (
+    ("Python Build",          "PythonBuild"),
+    ("Python Compiler",       "PythonCompiler"),
+    ("Python Branch",         "PythonBranch"),
+    ("Python Implementation", "PythonImplementation"),
+    ("Python Revision",       "PythonRevision"),
+    ("Python Version",        "PythonVersion"))]
+
+PROCESS_FIELDS = [(label, operator.attrgetter(attr)) for label, attr in (
+    ("Process ID",   "ProcessID"),
+    ("Name",         "ProcessName"),
+    ("Memory [RSS]", "ProcessMemory"),
+    ("Threads",      "ProcessThreads"),
+    ("CPU Usage",    "ProcessCPUusage"))]
+
+
+def loadSysInfo(cpuInterval=None):
+    """  Import systemInfo and create the SysInfo instance used by the collect functions.
+         cpuInterval, if given, is the minimum time in seconds the CPU usage is measured over.
+    """
+
+    global SI
+    import systemInfo
+
+    SI = systemInfo.SysInfo() if cpuInterval is None else systemInfo.SysInfo(cpuInterval)
 
 
-def printPlatfrom():
-    """   Print Platform specific information.
+def collectFields(fields, width):
+    """  Return a list of "label : value" lines, one for each (label, getter) in fields.
     """
 
-    print(f"System      : {SI.System}")
-    print(f"Hostname    : {SI.Hostname}")
-    print(f"Release     : {SI.Release}")
-    print(f"Version     : {SI.Version}")
-    print(f"Machine     : {SI.Machine}")
-    print(f"Processor   : {SI.Processor}")
-    print(f"Architecture: {SI.Architecture}")
-    print(f"IP Address  : {SI.IPaddress}")
-    print(f"MAC address : {SI.MACaddress}")
+    return [f"{label:<{width}}: {getter(SI)}" for label, getter in fields]
 
 
-def printBootTime():
-    """  Print Boot Time of the PC.
+def collectPlatform():
+    """   Return Platform specific information as a list of lines.
     """
 
-    print(f"Boot Time: {SI.BootTime}")
+    return collectFields(PLATFORM_FIELDS, 12)
 
 
-def printCPUInfo():
-    """  Print CPU specific information.
+def collectBootTime():
+    """  Return Boot Time of the PC as a list of lines.
     """
 
+    return [f"Boot Time: {SI.BootTime}"]
+
+
+def collectCPUInfo():
+    """  Return CPU specific information as a list of lines.
+    """
+
+    SI.harvestCPU()
+
     # number of cores
-    print(f"Physical cores   : {SI.PhysicalCores}")
-    print(f"Total cores      : {SI.TotalCores}")
+    lines = [f"Physical cores   : {SI.PhysicalCores}",
+             f"Total cores      : {SI.TotalCores}"]
 
     #  CPU frequencies
-    print(f"Max Frequency    : {SI.MaxFrequency}")
-    print(f"Min Frequency    : {SI.MinFrequency}")
-    print(f"Current Frequency: {SI.CurrentFrequency}")
+    lines.append(f"Max Frequency    : {SI.MaxFrequency}")
+    lines.append(f"Min Frequency    : {SI.MinFrequency}")
+    lines.append(f"Current Frequency: {SI.CurrentFrequency}")
 
     #  CPU usage
-    print("CPU Usage Per Core")
-    for i, percentage in enumerate(SI.CPUusage):
-        print(f"  Core {i}     : {percentage}%")
-    print(f"Total CPU Usage  : {SI.TotalCPUusage}")
+    lines.append("CPU Usage Per Core")
+    lines.extend(f"  Core {i}     : {percentage}%" for i, percentage in enumerate(SI.CPUusage))
+    lines.append(f"Total CPU Usage  : {SI.TotalCPUusage}")
 
+    return lines
 
-def printMemoryInfo():
-    """  Print Memory specific information.
-    """
 
-    #  get the memory details
-    print(f"Total Memory     : {SI.TotalMemory}")
-    print(f"Available Memory : {SI.AvailableMemory}")
-    print(f"Used Memory      : {SI.UsedMemory}")
-    print(f"Percentage Memory: {SI.PercentageMemory}")
+def collectMemoryInfo():
+    """  Return Memory and Swap specific information as a list of lines.
+    """
 
-    #  get the swap memory details (if exists)
-    print(f"Total Swap       : {SI.TotalSwap}")
-    print(f"Free Swap        : {SI.AvailableSwap}")
-    print(f"Used Swap        : {SI.UsedSwap}")
-    print(f"Percentage Swap  : {SI.PercentageSwap}")
+    return collectFields(MEMORY_FIELDS, 17)
 
 
-def printDiskInfo():
-    """  Print Disk specific information.
+def collectDiskInfo():
+    """  Return Disk specific information as a list of lines.
     """
 
+    lines = []
+
     #  get all disk partitions
-    disks = SI.DiskPartitions
-    for partition in disks:
-      print(f"=========== Device: {partition} =========")
-      print(f"  Mountpoint      : {disks[partition][0]}")
-      print(f"  File System Type: {disks[partition][1]}")
-      print(f"  Total Size      : {disks[partition][2]}")
-      print(f"  Used Space      : {disks[partition][3]}")
-      print(f"  Free Space      : {disks[partition][4]}")
-      print(f"  Percentage Used : {disks[partition][5]}")
+    for partition, info in SI.DiskPartitions.items():
+      mountpoint, fstype, total, used, free, percentage = info
+      lines.append(f"=========== Device: {partition} =========")
+      lines.append(f"  Mountpoint      : {mountpoint}")
+      lines.append(f"  File System Type: {fstype}")
+      lines.append(f"  Total Size      : {total}")
+      lines.append(f"  Used Space      : {used}")
+      lines.append(f"  Free Space      : {free}")
+      lines.append(f"  Percentage Used : {percentage}")
 
     #  getIO statistics since bootTime
-    print()
-    print(f"Total Read : {SI.DiskTotalRead}")
-    print(f"Total Write: {SI.DiskTotalWrite}")
+    lines.append("")
+    lines.append(f"Total Read : {SI.DiskTotalRead}")
+    lines.append(f"Total Write: {SI.DiskTotalWrite}")
 
+    return lines
 
-def printNetworkInfo():
-    """  Print Network specific information.
+
+def collectNetworkInfo():
+    """  Return Network specific information as a list of lines.
     """
 
+    lines = []
+
     #  get all network interfaces (virtual and physical)
-    nets = SI.Networks
-
-    for net in nets:
-      if nets[net][1] == 'AddressFamily.AF_INET':
-        print(f"=== Interface: {nets[net][0]} ===")
-        print(f"Address Family : {nets[net][1]}")
-        print(f"  IP Address   : {nets[net][2]}")
-        print(f"  Netmask      : {nets[net][3]}")
-        print(f"  Broadcast IP : {nets[net][4]}")
-      elif nets[net][1] == 'AddressFamily.AF_PACKET':
-        print(f"=== Interface: {nets[net][0]} ===")
-        print(f"Address Family : {nets[net][1]}")
-        print(f"  MAC Address  : {nets[net][2]}")
-        print(f"  Netmask      : {nets[net][3]}")
-        print(f"  Broadcast MAC: {nets[net][4]}")
-
-    print()
-    print(f"Total Bytes Sent    : {SI.TotalBytesSent}")
-    print(f"Total Bytes Received: {SI.TotalBytesReceived}")
-
-
-def printPythonInfo():
-    """  Print Python Compiler Information.
+    #  the addresses of an interface are listed together, so only print the header for the first.
+    header = None
+    for name, family, address, netmask, broadcast in SI.Networks.values():
+      if family not in (SI.AF_INET, SI.AF_LINK):
+        continue
+      if name != header:
+        lines.append(f"=== Interface: {name} ===")
+        header = name
+      if family == SI.AF_INET:
+        lines.append("Address Family : AF_INET")
+        lines.append(f"  IP Address   : {address}")
+        lines.append(f"  Netmask      : {netmask}")
+        lines.append(f"  Broadcast IP : {broadcast}")
+      else:
+        lines.append(f"Address Family : {getattr(family, 'name', 'AF_LINK')}")
+        lines.append(f"  MAC Address  : {address}")
+        lines.append(f"  Netmask      : {netmask}")
+        lines.append(f"  Broadcast MAC: {broadcast}")
+
+    lines.append("")
+    lines.append(f"Total Bytes Sent    : {SI.TotalBytesSent}")
+    lines.append(f"Total Bytes Received: {SI.TotalBytesReceived}")
+
+    return lines
+
+
+def collectPythonInfo():
+    """  Return Python Compiler Information as a list of lines.
+    """
+
+    return collectFields(PYTHON_FIELDS, 24)
+
+
+def collectProcessInfo():
+    """  Return information about this running process as a list of lines.
+    """
+
+    return collectFields(PROCESS_FIELDS, 12)
+
+
+def emit(lines):
+    """  Write a list of lines to stdout in one go.
     """
-    
-    print(f"Python Build            : {SI.PythonBuild}")
-    print(f"Python Compiler         : {SI.PythonCompiler}")
-    print(f"Python Branch           : {SI.PythonBranch}")
-    print(f"Python Implementation   : {SI.PythonImplementation}")
-    print(f"Python Revision         : {SI.PythonRevision}")
-    print(f"Python Version          : {SI.PythonVersion}")
-    
-    
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def emitRaw(lines):
+    """  Write a list of lines straight to the stdout file descriptor in one os.write,
+         bypassing the text layer.  Falls back to emit if stdout has no file descriptor.
+
+         Not on Windows, there the text layer is needed for the CR LF line endings
+         and to write to the console in its own encoding.
+    """
+
+    if sys.platform == "win32":
+        emit(lines)
+        return
+
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, ValueError):
+        emit(lines)
+        return
+
+    data = memoryview(("\n".join(lines) + "\n").encode(sys.stdout.encoding or "utf-8", "replace"))
+
+    sys.stdout.flush()
+    while data:
+        data = data[os.write(fd, data):]
+
+
+#  The sections of information - (menu entry, title, command line argument, collect function).
+SECTIONS = (("Platform",  "Platform Information", "platform", collectPlatform),
+            ("Boot Time", "Boot Time",            "bootTime", collectBootTime),
+            ("CPU",       "CPU Information",      "cpu",      collectCPUInfo),
+            ("Memory",    "Memory Information",   "memory",   collectMemoryInfo),
+            ("Disk",      "Disk Information",     "disk",     collectDiskInfo),
+            ("Network",   "Network Information",  "network",  collectNetworkInfo),
+            ("Python",    "Python Information",   "python",   collectPythonInfo),
+            ("Process",   "Process Information",  "process",  collectProcessInfo))
+
+MENU_ALL  = str(len(SECTIONS) + 1)
+MENU_QUIT = str(len(SECTIONS) + 2)
+MENU      = "Please select one of the following:\n" + "".join(
+    f"{number}. {entry}\n" for number, entry in enumerate([section[0] for section in SECTIONS] + ["All", "Quit"], 1))
+
+
+def positiveFloat(text):
+    """  argparse type for a number of seconds, must be greater than zero.
+    """
+
+    import argparse
+
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}' is not a number") from None
+
+    if not 0 < value < float("inf"):        #  also catches nan.
+        raise argparse.ArgumentTypeError(f"must be a number of seconds greater than zero, not {text}")
+
+    return value
+
+
 def printShortLicense():
     print(f"""
 PySystemInfo {__version__}   Copyright (C) 2020-2021  Kevin Scott
@@ -185,97 +315,115 @@ def printLongLicense():
     """, end="")
 
 
-def printSeperator(title):
-    print("="*30, title, "="*30)
+def seperator(title):
+    return f"{SEPERATOR} {title} {SEPERATOR}"
 
 
-def printFromArgs(args):
-    """  Print the specified information from the command line arguments.
+def collectSections(sections):
+    """  Return the lines for a list of (title, collect function) sections, each headed by its seperator.
+
+         The sections are collected concurrently, psutil releases the GIL while it
+         waits on the OS, and returned in the order given.  They share one SysInfo
+         oneshot, so each psutil reading is taken once for them all.
+    """
+
+    import concurrent.futures
+
+    with SI.oneshot(), concurrent.futures.ThreadPoolExecutor(max_workers=max(len(sections), 1)) as executor:
+        futures = [(title, executor.submit(collect)) for title, collect in sections]
+
+        lines = []
+        for title, future in futures:
+            lines.append(seperator(title))
+            lines.extend(future.result())
+
+    return lines
+
+
+def collectProfile():
+    """  Return the read times of the SysInfo properties as a list of lines, slowest cold read first.
+         Uses a fresh SysInfo, so the first reads aren't answered from the caches.
     """
 
-    if args.platform or args.all:
-        printSeperator("Platform Information")
-        printPlatfrom()
+    timings = type(SI)(SI.cpuInterval).timeProperties()
 
-    if args.bootTime or args.all:
-        printSeperator("Boot Time")
-        printBootTime()
+    lines = [f"{'Property':<22}: {'first [us]':>12} {'mean [us]':>12}"]
+    for name, (first, mean) in sorted(timings.items(), key=lambda timing: timing[1][0], reverse=True):
+        lines.append(f"{name:<22}: {first / 1000:>12.1f} {mean / 1000:>12.1f}")
 
-    if args.cpu or args.all:
-        printSeperator("CPU Information")
-        printCPUInfo()
+    return lines
 
-    if args.memory or args.all:
-        printSeperator("Memory Information")
-        printMemoryInfo()
 
-    if args.disk or args.all:
-        printSeperator("Disk Information")
-        printDiskInfo()
+def printFromArgs(args):
+    """  Print the specified information from the command line arguments, with a single write.
+    """
+
+    everything = args.all
+    enabled    = [(title, collect) for _, title, argument, collect in SECTIONS
+                  if everything or getattr(args, argument)]
+
+    lines = collectSections(enabled)
+
+    if PROFILE:                       #  timed on its own, after the sections, so they don't skew it.
+        lines += [seperator("Property Timings")] + collectProfile()
+
+    emitRaw(lines)
 
-    if args.network or args.all:
-        printSeperator("Network Information")
-        printNetworkInfo()
-        
-    if args.python or args.all:
-        printSeperator("Python Information")
-        printPythonInfo()
 
 def printFromMenu():
     """  Print the specified information from the menu option chosen.
+         An option can be chosen by its number or its name.
     """
 
+    menu = {str(number): [(title, collect)] for number, (_, title, _, collect) in enumerate(SECTIONS, 1)}
+    menu[MENU_ALL] = [(title, collect) for _, title, _, collect in SECTIONS]
+
+    SI.startSampler()                 #  the menu runs for a while, keep the CPU usage current.
+
+    #  also allow the option names, in lower case.
+    names = {entry.lower(): str(number) for number, (entry, _, _, _) in enumerate(SECTIONS, 1)}
+    names.update({"all": MENU_ALL, "quit": MENU_QUIT})
+
     while True:
         print()
-        responce = pyip.inputMenu(["Platform", "Boot Time",
-                                   "CPU", "Memory", "Disk", "Network",
-                                   "Python", "All", "Quit"], numbered=True)
-
-        if responce == "Platform" or responce == "All":
-            printSeperator("Platform Information")
-            printPlatfrom()
-
-        if responce == "Boot Time" or responce == "All":
-            printSeperator("Boot Time")
-            printBootTime()
-
-        if responce == "CPU" or responce == "All":
-            printSeperator("CPU Information")
-            printCPUInfo()
-
-        if responce == "Memory" or responce == "All":
-            printSeperator("Memory Information")
-            printMemoryInfo()
-
-        if responce == "Disk" or responce == "All":
-            printSeperator("Disk Information")
-            printDiskInfo()
-
-        if responce == "Network" or responce == "All":
-            printSeperator("Network Information")
-            printNetworkInfo()
-            
-        if responce == "Python" or responce == "All":
-            printSeperator("Python Information")
-            printPythonInfo()
-
-        if responce == "Quit":
+        try:
+            responce = input(MENU).strip()
+        except EOFError:
+            break
+
+        responce = names.get(responce.lower(), responce)
+
+        if responce == MENU_QUIT:
             break
 
+        if responce not in menu:
+            print(f"'{responce}' is not a valid choice.")
+            continue
+
+        emit(collectSections(menu[responce]))
+
+
 if __name__ == "__main__":
     """  Main program bit.
          Either process the command line arguments or the menu options.
     """
 
+    if len(sys.argv) == 1:            # No command arguments given, run the menu.
+        printShortLicense()
+        loadSysInfo()
+        printFromMenu()
+        sys.exit(0)
+
+    if sys.argv[1:] in (["-v"], ["--version"]):     # Answer quickly, without building the parser.
+        print(f"{os.path.basename(sys.argv[0])} {__version__}")
+        sys.exit(0)
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         formatter_class = argparse.RawTextHelpFormatter,
-        description=textwrap.dedent("""\
-        System and hardware Information from Python.
-        -----------------------
-        Prints a lot of stuff about the Platform, CPU and Network."""),
-        epilog = """ If no arguments are given, a Menu will be displayed.
-
-        Kevin Scott (C) 2020-2021""")
+        description=DESCRIPTION,
+        epilog = EPILOG)
 
     parser.add_argument("-a", "--all",      action="store_true", help="Print All the Info.")
     parser.add_argument("-p", "--platform", action="store_true", help="Print the Platform Info.")
@@ -285,18 +433,22 @@ if __name__ == "__main__":
     parser.add_argument("-d", "--disk",     action="store_true", help="Print the Disk Info.")
     parser.add_argument("-n", "--network",  action="store_true", help="Print the NetWork Info.")
     parser.add_argument("-py", "--python",  action="store_true", help="Print the Python Info.")
+    parser.add_argument("-P", "--process",  action="store_true", help="Print the Process Info.")
+    parser.add_argument("-i", "--interval", type=positiveFloat, metavar="SECS",
+                        help="Minimum time the CPU usage is measured over [default 0.1].")
     parser.add_argument("-v", "--version",  action="version",    version=f"%(prog)s {__version__}")
     parser.add_argument("-l", "--license",  action="store_true", help="Print the Software License.")
     args = parser.parse_args()
 
-    if not any(vars(args).values()):  # No command arguments given, run the menu.
-        printShortLicense()
-        printFromMenu()
-        sys.exit(0)
-
     if args.license:
         printLongLicense()
         sys.exit(0)
 
-    printFromArgs(args)               # Must be command line arguments, so process.
+    loadSysInfo(args.interval)
+
+    if args.all or any(getattr(args, argument) for _, _, argument, _ in SECTIONS):
+        printFromArgs(args)           # Must be command line arguments, so process.
+    else:                             # Only options given, run the menu with them.
+        printShortLicense()
+        printFromMenu()
 
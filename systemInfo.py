@@ -5,7 +5,7 @@
 #                                                                               #
 #  Kevin Scott (C) 2020-2021                                                    #
 #                                                                               #
-#  NB : Needs psutil & pyinputplus, not in the Python Standard Library          #
+#  NB : Needs psutil, not in the Python Standard Library                        #
 #                                                                               #
 #################################################################################
 #                                                                               #
@@ -24,13 +24,89 @@
 #                                                                               #
 #################################################################################
 
-import re
-import uuid
+import time
 import psutil
 import socket
+import weakref
 import platform
+import functools
+import threading
+import contextlib
 
 from datetime import datetime
+from dataclasses import dataclass
+
+UNITS  = ("", "K", "M", "G", "T", "P")                #  size prefixes used by getSize,
+SCALES = tuple(1 << (10 * i) for i in range(6))      #  and the divisor for each.
+
+#  Virtual and network file systems, skipped when listing partitions.
+SKIPPED_FILESYSTEMS = {"squashfs", "tmpfs", "devtmpfs", "overlay", "autofs", "proc", "sysfs",
+                       "nfs", "nfs4", "cifs", "smbfs", "fuse.sshfs", "fuse.gvfsd-fuse"}
+
+REFRESH      = 1.0     #  seconds a reading from psutil is reused for.
+CPU_INTERVAL = 0.1     #  minimum seconds between CPU usage samples, less gives meaningless figures.
+DISK_TIMEOUT = 1.0     #  seconds to wait for the partitions to report their usage.
+
+
+def ttlCache(interval):
+    """  Decorator that caches the result of a method for [about] interval seconds.
+
+         The cache is keyed on the current time slot, time.monotonic()//interval,
+         so all calls made within the same slot share the one result.
+         If the methods object has a clock() method, that is used for the time instead.
+
+         Each object keeps just its latest result, held weakly so the object can still be freed.
+         Calls from several threads are serialised, so a reading is only taken once per slot.
+    """
+    def decorator(func):
+        cache = weakref.WeakKeyDictionary()     #  object => (key, result).
+        lock  = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            clock = getattr(self, "clock", time.monotonic)
+            with lock:
+                key = (args, tuple(sorted(kwargs.items())), clock() // interval)
+                cached = cache.get(self)
+                if cached is not None and cached[0] == key:
+                    return cached[1]
+
+                result      = func(self, *args, **kwargs)
+                cache[self] = (key, result)
+            return result
+        return wrapper
+    return decorator
+
+
+@dataclass(frozen=True)
+class CPUSample:
+    """  One reading of the CPU, as the raw SysInfo properties of the same name,
+         taken together by SysInfo.harvestCPU or the sampler.
+    """
+    CurrentFrequencyFloat : float
+    CPUusage              : tuple
+    TotalCPUusageFloat    : float
+    sampled               : float      #  time.monotonic() when it was taken.
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """  The changing memory, swap, disk and network values, as the raw SysInfo properties
+         of the same name, all taken in one pass by SysInfo.snapshot.
+         Those published by the sampler also carry the CPUSample taken with them.
+    """
+    AvailableMemoryBytes  : int
+    UsedMemoryBytes       : int
+    PercentageMemoryFloat : float
+    AvailableSwapBytes    : int
+    UsedSwapBytes         : int
+    PercentageSwapFloat   : float
+    DiskTotalReadBytes    : int        #  the IO counters are None if psutil found no disks,
+    DiskTotalWriteBytes   : int
+    TotalSentBytes        : int        #  or no network cards.
+    TotalReceivedBytes    : int
+    CPU                   : CPUSample = None
+
 
 class SysInfo:
     """  A class that collects and returns information about the system.
@@ -53,9 +129,9 @@ class SysInfo:
       CPU [All returned as Strings]
         PhysicalCores    : The number of physical cores of the CPU.
         TotalCores       : The number of Total cores of the CPU.
-        MaxFrequency     : The maximum frequency of the CPU [in MHz].
-        MinFrequency     : The minimum frequency of the CPU [in MHz].
-        CurrentFrequency : The current frequency of the CPU [in MHz].
+        MaxFrequency     : The maximum frequency of the CPU [in MHz, or "unavailable"].
+        MinFrequency     : The minimum frequency of the CPU [in MHz, or "unavailable"].
+        CurrentFrequency : The current frequency of the CPU [in MHz, or "unavailable"].
         CPUusage         : A *list* containing the usage for each individual core [in %].
         TotalCPUusage    : The current overall usage of the CPU [in %].
 
@@ -72,20 +148,20 @@ class SysInfo:
 
       Disk [Returned as a Dictionary]
         key  [string]          : Device name..
-        data [list of strings] : Mountpoint
+        data [tuple of strings]: Mountpoint
                                : File System Type
                                : Total Size
                                : Used Space
                                : Free Space
                                : Percentage used
 
-        DiskTotalRead  [string]: Total read from all disks since boot time.
-        DiskTotalWrite [string]: Total written to all disks since boot time.
+        DiskTotalRead  [string]: Total read from all disks since boot time [or "unavailable"].
+        DiskTotalWrite [string]: Total written to all disks since boot time [or "unavailable"].
 
-      Networks [Returned as a Dictionary]
+      Networks [Returned as a Dictionary, only interfaces that are up]
         key                    : unique integer ID
-        data [list of strings] : Interface Name
-                               : Family
+        data [tuple]           : Interface Name
+                               : Family [socket.AddressFamily, compare with AF_INET / AF_LINK]
                                : IP Address or MAC Address
                                : Netmask
                                : Broadcast IP
@@ -100,8 +176,77 @@ class SysInfo:
           PythonImplementation : Returns a string identifying the Python implementation. Possible return values are: ‘CPython’, ‘IronPython’, ‘Jython’, ‘PyPy’.
           PythonRevision       : Returns a string identifying the Python implementation SCM revision.
           PythonVersion        : Returns the Python version as string 'major.minor.patchlevel'.
+
+      Process [This running program, all returned as Strings]
+          ProcessID            : The process ID.
+          ProcessName          : The process name.
+          ProcessMemory        : The resident memory used by the process [in suitable format].
+          ProcessThreads       : The number of threads in the process.
+          ProcessCPUusage      : The CPU usage of the process since the last reading [in %].
+
+      Raw values [The numbers behind the strings above, for callers that want to do their own formatting]
+          MaxFrequencyFloat, MinFrequencyFloat, CurrentFrequencyFloat : [float, in MHz].
+          TotalCPUusageFloat                                          : [float, in %].
+          TotalMemoryBytes, AvailableMemoryBytes, UsedMemoryBytes     : [int, in bytes].
+          PercentageMemoryFloat                                       : [float, in %].
+          TotalSwapBytes, AvailableSwapBytes, UsedSwapBytes           : [int, in bytes].
+          PercentageSwapFloat                                         : [float, in %].
+          DiskTotalReadBytes, DiskTotalWriteBytes                     : [int, in bytes, None if there are no disks].
+          TotalSentBytes, TotalReceivedBytes                          : [int, in bytes, for TotalBytesSent/Received,
+                                                                         None if there are no network cards].
     """
 
+    #  The changing state lives in slots, "__dict__" is kept for the cached_property values.
+    __slots__ = ("cpuSampled", "cpuInterval", "cpuSample",
+                 "sampler", "samplerStop", "samplerPeriod", "currentSnapshot", "diskQueries", "process", "processSampled",
+                 "oneshotTime", "oneshotSnapshot", "__dict__", "__weakref__")
+
+    def __init__(self, cpuInterval=CPU_INTERVAL):
+        #  Prime the CPU usage counters, later non-blocking calls return the usage since this point.
+        psutil.cpu_percent(interval=None, percpu=True)
+        self.cpuSampled  = time.monotonic()
+        self.cpuInterval = cpuInterval
+        self.cpuSample   = None       #  no harvest yet, see harvestCPU.
+        self.sampler     = None       #  the background sampler, see startSampler.
+
+        self.currentSnapshot = None   #  the last Snapshot published by the sampler.
+        self.diskQueries     = {}     #  mountpoint => the diskUsage query thread still running for it.
+
+        self.process = psutil.Process()
+        self.process.cpu_percent()
+        self.processSampled = time.monotonic()
+
+        self.oneshotTime     = None   #  set while inside oneshot,
+        self.oneshotSnapshot = None   #  with the sampler's snapshot at the time, if it is running.
+
+
+    def clock(self):
+        """  The time used for the cached readings, it stands still inside oneshot.
+        """
+        return self.oneshotTime or time.monotonic()
+
+
+    @contextlib.contextmanager
+    def oneshot(self):
+        """  Within this context the cached readings don't expire, so values used together
+             all come from the same psutil calls, each made at most once.
+             If the sampler is running, its snapshot is held for the whole context.
+
+                 with SI.oneshot():
+                     print(SI.TotalMemory, SI.UsedMemory)
+        """
+        if self.oneshotTime is not None:          #  already inside one.
+            yield self
+            return
+
+        self.oneshotTime     = time.monotonic()
+        self.oneshotSnapshot = self.samplerSnapshot()
+        try:
+            yield self
+        finally:
+            self.oneshotTime     = None
+            self.oneshotSnapshot = None
+
 
     def getSize(self, bytes, suffix="B"):
         """  Returns a human readable format of a size given in bytes.
@@ -109,225 +254,601 @@ class SysInfo:
             1253656 => "1.20MB"
             1253656678 => "1.17GB"
         """
-        factor = 1024
-        for unit in ["", "K", "M", "G", "T", "P"]:
-            if bytes < factor:
-                return f"{bytes:.2f}{unit}{suffix}"
-            bytes /= factor
+        i = min((int(bytes).bit_length() - 1) // 10, 5) if bytes >= 1 else 0
+        return f"{bytes / SCALES[i]:.2f}{UNITS[i]}{suffix}"
+
+
+    def timeProperties(self, iterations=100):
+        """  Returns a dictionary of property name => (first, mean) read time in nanoseconds,
+             first being the cold read and mean the average over the iterations after it.
+
+             For finding which readings dominate a refresh on this host, and so which
+             caches are worth tuning.  Use a fresh SysInfo, or the first reads are already cached.
+
+             The CPU and process usage are harvested before the timing starts, their deliberate
+             wait for cpuInterval would otherwise show as the slowest read.
+        """
+        self.harvestCPU()
+        self.processInfo()
+
+        timings = {}
+        for name in dir(type(self)):
+            if not name[0].isupper() or not isinstance(getattr(type(self), name), (property, functools.cached_property)):
+                continue
+
+            start = time.perf_counter_ns()
+            getattr(self, name)
+            first = time.perf_counter_ns() - start
+
+            start = time.perf_counter_ns()
+            for _ in range(iterations):
+                getattr(self, name)
+            timings[name] = (first, (time.perf_counter_ns() - start) // max(iterations, 1))
+
+        return timings
 
 
     uname = platform.uname()
 
-    @property
+    @functools.cached_property
     def System(self):
         return self.uname.system
 
-    @property
+    @functools.cached_property
     def Hostname(self):
         return self.uname.node
 
-    @property
+    @functools.cached_property
     def Release(self):
         return self.uname.release
 
-    @property
+    @functools.cached_property
     def Version(self):
         return self.uname.version
 
-    @property
+    @functools.cached_property
     def Machine(self):
         return self.uname.machine
 
-    @property
+    @functools.cached_property
     def Processor(self):
+        #  platform leaves this empty on most Linux systems, so fall back to the model name in /proc/cpuinfo.
+        if self.uname.processor or self.uname.system != "Linux":
+            return self.uname.processor
+
+        try:
+            with open("/proc/cpuinfo") as cpuinfo:
+                for line in cpuinfo:
+                    if line.startswith("model name"):
+                        return line.split(":", 1)[1].strip()
+        except OSError:
+            pass
+
         return self.uname.processor
 
-    @property
+    @functools.cached_property
     def Architecture(self):
         return platform.architecture()[0]
 
-    @property
-    def IPaddress(self):
-        return socket.gethostbyname(socket.gethostname())
+    @ttlCache(60.0)                     #  can change [DHCP], but not often.
+    def routeAddress(self):
+        """  Returns the local IPv4 address of the default route, or None if there isn't one.
+
+             Connecting a UDP socket sends nothing, it just has the kernel pick the route,
+             so this needs no DNS lookup.
+        """
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+        except OSError:
+            return None
+        finally:
+            s.close()
 
     @property
+    def IPaddress(self):
+        #  The IPv4 addresses on interfaces that are up, other than loopback and link local [169.254.x.x],
+        #  from the same cached readings as Networks.
+        stats     = self.ifStats()
+        addresses = [address.address for interfaceName, interfaceAddresses in self.ifAddrs().items()
+                     if interfaceName not in stats or stats[interfaceName].isup
+                     for address in interfaceAddresses
+                     if address.family == socket.AF_INET
+                     and not address.address.startswith(("127.", "169.254."))]
+
+        #  Prefer the one holding the default route, so a bridge or VPN listed first doesn't win.
+        route = self.routeAddress()
+        if route in addresses:
+            return route
+
+        return addresses[0] if addresses else "127.0.0.1"
+
+    @functools.cached_property
     def MACaddress(self):
-        return ':'.join(re.findall('..', '%012x' % uuid.getnode()))
+        import uuid     #  only needed here, and slow to import.
 
-    @property
+        mac = f"{uuid.getnode():012x}"
+        return ':'.join(mac[i:i+2] for i in range(0, 12, 2))
+
+    @functools.cached_property
     def BootTime(self):
-        bootTime = psutil.boot_time()
-        bt       = datetime.fromtimestamp(bootTime)
-        return f"Boot Time: {bt.day:02}/{bt.month:02}/{bt.year:02} {bt.hour:02}:{bt.minute:02}:{bt.second:02}"
+        return f"{datetime.fromtimestamp(psutil.boot_time()):%d/%m/%Y %H:%M:%S}"
+
+    def harvestCPU(self):
+        """  Returns a CPUSample, the CPU information harvested in one pass.
+
+             While the sampler is running this is the one in its snapshot.  Otherwise the
+             current frequency and usage are read here once and stored as a whole,
+             calls within REFRESH seconds of the last harvest share it.
+
+             The usage is measured since the previous sample, if that was less than
+             cpuInterval seconds ago, wait out the rest of the interval first.
+        """
+        snapshot = self.oneshotSnapshot or self.samplerSnapshot()
+        if snapshot is not None:
+            return snapshot.CPU
+
+        sample = self.cpuSample
+        if sample is not None and self.clock() - sample.sampled < REFRESH:
+            return sample
+
+        wait = self.cpuSampled + self.cpuInterval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+        cpuFreq         = psutil.cpu_freq()
+        cpuPercent      = psutil.cpu_percent(interval=None, percpu=True)
+        self.cpuSampled = time.monotonic()
+
+        sample = self.cpuSample = self.makeCPUSample(cpuFreq, cpuPercent, self.cpuSampled)
+        return sample
+
+    def makeCPUSample(self, cpuFreq, cpuPercent, sampled):
+        #  cpu_freq gives None where the OS doesn't report frequencies.
+        return CPUSample(CurrentFrequencyFloat = cpuFreq.current if cpuFreq is not None else None,
+                         CPUusage              = tuple(cpuPercent),
+                         TotalCPUusageFloat    = round(sum(cpuPercent) / len(cpuPercent), 1),     #  no need to sample twice.
+                         sampled               = sampled)
+
+    def startSampler(self, period=None):
+        """  Keep the CPU harvest and the snapshot up to date from one background thread,
+             sampling the CPU usage over every period seconds [by default REFRESH, or cpuInterval if longer]
+             and then taking a new snapshot, so all the changing values come from the same moment.
+             The properties then just read the latest sample, without waiting.
+        """
+        if self.sampler is not None:
+            return
+
+        if period is None:
+            period = max(REFRESH, self.cpuInterval)
+
+        self.samplerStop   = threading.Event()
+        self.samplerPeriod = period
+        self.sampler       = threading.Thread(target=self.sample, args=(period,), daemon=True)
+        self.sampler.start()
+
+    def stopSampler(self):
+        """  Stop the background sampler, waits for the current sample to finish.
+        """
+        if self.sampler is None:
+            return
+
+        self.samplerStop.set()
+        self.sampler.join()
+        self.sampler         = None
+        self.currentSnapshot = None
+
+    def sample(self, period):
+        while not self.samplerStop.is_set():
+            try:
+                cpuPercent      = psutil.cpu_percent(interval=period, percpu=True)
+                self.cpuSampled = time.monotonic()
+                cpu             = self.makeCPUSample(psutil.cpu_freq(), cpuPercent, self.cpuSampled)
+
+                #  read psutil directly, the cached readings follow the callers clock.
+                #  The whole sample is published by the one assignment, so readers never see half of it.
+                self.currentSnapshot = self.makeSnapshot(psutil.virtual_memory(), psutil.swap_memory(),
+                                                         psutil.disk_io_counters(), psutil.net_io_counters(), cpu)
+            except Exception:
+                #  A failed reading just skips this tick, rather than killing the sampler
+                #  [and printing a traceback into the menu].  Wait before trying again.
+                self.samplerStop.wait(period)
+
+    def samplerSnapshot(self):
+        """  Returns the sampler's latest Snapshot, or None if it isn't running, has died
+             or hasn't published one for two periods - the callers then read psutil themselves.
+        """
+        sampler, current = self.sampler, self.currentSnapshot
+        if sampler is None or current is None or not sampler.is_alive():
+            return None
+
+        if time.monotonic() - current.CPU.sampled > 2 * self.samplerPeriod:
+            return None
+
+        return current
 
     # number of cores
-    @property
+    @functools.cached_property
     def PhysicalCores(self):
         return psutil.cpu_count(logical=False)
 
-    @property
+    @functools.cached_property
     def TotalCores(self):
         return psutil.cpu_count(logical=True)
 
-    #  CPU frequencies
-    cpuFreq = psutil.cpu_freq()
+    #  CPU frequencies, the limits don't change so are only read once.
+    @functools.cached_property
+    def cpuFreqLimits(self):
+        return psutil.cpu_freq()
 
-    @property
+    @functools.cached_property
+    def MaxFrequencyFloat(self):
+        return self.cpuFreqLimits.max if self.cpuFreqLimits is not None else None
+
+    @functools.cached_property
     def MaxFrequency(self):
-        return f"{self.cpuFreq.max:.2f}MHz"
+        return "unavailable" if self.MaxFrequencyFloat is None else f"{self.MaxFrequencyFloat:.2f}MHz"
 
-    @property
+    @functools.cached_property
+    def MinFrequencyFloat(self):
+        return self.cpuFreqLimits.min if self.cpuFreqLimits is not None else None
+
+    @functools.cached_property
     def MinFrequency(self):
-        return f"{self.cpuFreq.min:.2f}MHz"
+        return "unavailable" if self.MinFrequencyFloat is None else f"{self.MinFrequencyFloat:.2f}MHz"
+
+    @property
+    def CurrentFrequencyFloat(self):
+        return self.harvestCPU().CurrentFrequencyFloat
 
     @property
     def CurrentFrequency(self):
-        return f"{self.cpuFreq.current:.2f}MHz"
+        current = self.CurrentFrequencyFloat
+        return "unavailable" if current is None else f"{current:.2f}MHz"
 
     #  CPU usage
     @property
     def CPUusage(self):
-        p = []           #  create empty list.
+        return list(self.harvestCPU().CPUusage)
 
-        for i, percentage in enumerate(psutil.cpu_percent(percpu=True)):
-            p.append(percentage)
-        return p
+    @property
+    def TotalCPUusageFloat(self):
+        return self.harvestCPU().TotalCPUusageFloat
 
     @property
     def TotalCPUusage(self):
-        return f"{psutil.cpu_percent()}%"
+        return f"{self.TotalCPUusageFloat}%"
+
+    def snapshot(self):
+        """  Returns a Snapshot of the changing memory, swap, disk and network values.
+
+             While the sampler is running this is the last one it published [or the one held
+             by oneshot], otherwise one is taken now and shared for REFRESH seconds.
+             The properties below just return, or format, the field from the latest snapshot.
+        """
+        snapshot = self.oneshotSnapshot or self.samplerSnapshot()
+        if snapshot is not None:
+            return snapshot
+
+        return self.takeSnapshot()
+
+    @ttlCache(REFRESH)
+    def takeSnapshot(self):
+        return self.makeSnapshot(self.svmem(), self.swap(), self.diskIO(), self.netIO())
+
+    def makeSnapshot(self, vmem, swap, diskIO, netIO, cpu=None):
+        """  Copies the raw psutil readings, and any CPUSample, into a Snapshot, nothing is formatted here.
+        """
+        #  pull the fields out once into locals, rather than a dotted lookup per use.
+        memAvailable, memUsed, memPercent = vmem.available, vmem.used, vmem.percent
+        swapFree, swapUsed, swapPercent   = swap.free, swap.used, swap.percent
+        #  psutil gives None for the IO counters if it finds no disks or network cards.
+        readBytes, writeBytes             = (diskIO.read_bytes, diskIO.write_bytes) if diskIO is not None else (None, None)
+        bytesSent, bytesRecv              = (netIO.bytes_sent, netIO.bytes_recv)    if netIO  is not None else (None, None)
+
+        return Snapshot(AvailableMemoryBytes  = memAvailable,
+                        UsedMemoryBytes       = memUsed,
+                        PercentageMemoryFloat = memPercent,
+                        AvailableSwapBytes    = swapFree,
+                        UsedSwapBytes         = swapUsed,
+                        PercentageSwapFloat   = swapPercent,
+                        DiskTotalReadBytes    = readBytes,
+                        DiskTotalWriteBytes   = writeBytes,
+                        TotalSentBytes        = bytesSent,
+                        TotalReceivedBytes    = bytesRecv,
+                        CPU                   = cpu)
 
     #  get the memory details
-    svmem = psutil.virtual_memory()
+    @ttlCache(REFRESH)
+    def svmem(self):
+        return psutil.virtual_memory()
 
-    @property
+    @functools.cached_property
+    def TotalMemoryBytes(self):
+        return self.svmem().total
+
+    @functools.cached_property
     def TotalMemory(self):
-        return self.getSize(self.svmem.total)
+        return self.getSize(self.TotalMemoryBytes)
+
+    @property
+    def AvailableMemoryBytes(self):
+        return self.snapshot().AvailableMemoryBytes
 
     @property
     def AvailableMemory(self):
-        return self.getSize(self.svmem.available)
+        return self.getSize(self.AvailableMemoryBytes)
+
+    @property
+    def UsedMemoryBytes(self):
+        return self.snapshot().UsedMemoryBytes
 
     @property
     def UsedMemory(self):
-        return self.getSize(self.svmem.used)
+        return self.getSize(self.UsedMemoryBytes)
+
+    @property
+    def PercentageMemoryFloat(self):
+        return self.snapshot().PercentageMemoryFloat
 
     @property
     def PercentageMemory(self):
-        return f"{self.svmem.percent}%"
+        return f"{self.PercentageMemoryFloat}%"
 
     #  get the swap memory details (if exists)
-    swap = psutil.swap_memory()
+    @ttlCache(REFRESH)
+    def swap(self):
+        return psutil.swap_memory()
 
-    @property
+    @functools.cached_property
+    def TotalSwapBytes(self):
+        return self.swap().total
+
+    @functools.cached_property
     def TotalSwap(self):
-        return self.getSize(self.swap.total)
+        return self.getSize(self.TotalSwapBytes)
+
+    @property
+    def AvailableSwapBytes(self):
+        return self.snapshot().AvailableSwapBytes
 
     @property
     def AvailableSwap(self):
-        return self.getSize(self.swap.free)
+        return self.getSize(self.AvailableSwapBytes)
+
+    @property
+    def UsedSwapBytes(self):
+        return self.snapshot().UsedSwapBytes
 
     @property
     def UsedSwap(self):
-        return self.getSize(self.swap.used)
+        return self.getSize(self.UsedSwapBytes)
+
+    @property
+    def PercentageSwapFloat(self):
+        return self.snapshot().PercentageSwapFloat
 
     @property
     def PercentageSwap(self):
-        return f"{self.swap.percent}%"
+        return f"{self.PercentageSwapFloat}%"
 
 
-    #  get all disk partitions
-    partitions = psutil.disk_partitions()
+    #  get all physical disk partitions
+    @ttlCache(REFRESH)
+    def partitions(self):
+        return psutil.disk_partitions(all=False)
+
+    @ttlCache(REFRESH)
+    def diskUsage(self, mountpoints, timeout=DISK_TIMEOUT):
+        """  Returns a dictionary of mountpoint => psutil.disk_usage, for a tuple of mountpoints.
+
+             Each mountpoint is queried in its own daemon thread, so a stuck mount can't
+             freeze the program.  A mountpoint that hasn't answered within timeout seconds
+             [for them all] is marked as None.
+
+             A query that is still stuck from an earlier call is left to finish, the mountpoint
+             is marked as None without starting another, so the threads don't pile up.
+        """
+        usage   = {}
+        threads = {}
+
+        def query(mountpoint):
+            try:
+                usage[mountpoint] = psutil.disk_usage(mountpoint)
+            except OSError:
+                #  This can be caught due to disk that isn't ready [PermissionError] or has gone away
+                pass
+
+        for mountpoint in mountpoints:
+            outstanding = self.diskQueries.get(mountpoint)
+            if outstanding is not None and outstanding.is_alive():
+                continue
+
+            threads[mountpoint] = self.diskQueries[mountpoint] = threading.Thread(target=query, args=(mountpoint,), daemon=True)
+            threads[mountpoint].start()
+
+        answered = {}
+        deadline = time.monotonic() + timeout
+        for mountpoint in mountpoints:
+            thread = threads.get(mountpoint)
+            if thread is not None:
+                thread.join(max(0, deadline - time.monotonic()))
+
+            if thread is None or thread.is_alive():
+                answered[mountpoint] = None
+            else:
+                self.diskQueries.pop(mountpoint, None)
+                if mountpoint in usage:
+                    answered[mountpoint] = usage[mountpoint]
+
+        return answered
 
     @property
     def DiskPartitions(self):
         p = {}           #  Create empty dictionary
 
-        for partition in self.partitions:
-            l = []           #  create empty list.
-            try:
-                partition_usage = psutil.disk_usage(partition.mountpoint)
-            except PermissionError:
-                #  This can be caught due to disk that isn't ready
+        #  Skip disks that aren't ready and virtual file systems, they can stall disk_usage
+        partitions = [partition for partition in self.partitions()
+                      if partition.fstype and partition.fstype not in SKIPPED_FILESYSTEMS]
+        #  stacked mounts share a mountpoint, it only needs querying once.
+        usage = self.diskUsage(tuple(dict.fromkeys(partition.mountpoint for partition in partitions)))
+
+        for partition in partitions:
+            if partition.mountpoint not in usage:
+                continue
+            partition_usage = usage[partition.mountpoint]
+            if partition_usage is None:
+                p[partition.device] = (partition.mountpoint, partition.fstype) + ("unavailable",) * 4
                 continue
-            l.append(partition.mountpoint)
-            l.append(partition.fstype)
-            l.append(self.getSize(partition_usage.total))
-            l.append(self.getSize(partition_usage.used))
-            l.append(self.getSize(partition_usage.free))
-            l.append(f"{self.getSize(partition_usage.percent)}%")
-
-            p[partition.device] = l
+
+            p[partition.device] = (partition.mountpoint,
+                                   partition.fstype,
+                                   self.getSize(partition_usage.total),
+                                   self.getSize(partition_usage.used),
+                                   self.getSize(partition_usage.free),
+                                   f"{partition_usage.percent}%")
         return p
 
     #  getIO statistics since bootTime
-    diskIO = psutil.disk_io_counters()
+    @ttlCache(REFRESH)
+    def diskIO(self):
+        return psutil.disk_io_counters()
+
+    @property
+    def DiskTotalReadBytes(self):
+        return self.snapshot().DiskTotalReadBytes
 
     @property
     def DiskTotalRead(self):
-        return self.getSize(self.diskIO.read_bytes)
+        value = self.DiskTotalReadBytes
+        return "unavailable" if value is None else self.getSize(value)
+
+    @property
+    def DiskTotalWriteBytes(self):
+        return self.snapshot().DiskTotalWriteBytes
 
     @property
     def DiskTotalWrite(self):
-        return self.getSize(self.diskIO.write_bytes)
+        value = self.DiskTotalWriteBytes
+        return "unavailable" if value is None else self.getSize(value)
+
+    #  The address families, to tell the Networks entries apart without importing socket or psutil.
+    AF_INET = socket.AF_INET
+    AF_LINK = psutil.AF_LINK        #  the MAC address family, AF_PACKET on Linux.
 
     #  get all network interfaces (virtual and physical)
-    ifAddrs = psutil.net_if_addrs()
+    @ttlCache(REFRESH)
+    def ifAddrs(self):
+        return psutil.net_if_addrs()
+
+    @ttlCache(REFRESH)
+    def ifStats(self):
+        return psutil.net_if_stats()
 
     @property
     def Networks(self):
         p = {}           #  Create empty dictionary
         n = 0
 
-        for interfaceName, interfaceAddresses in self.ifAddrs.items():
+        stats = self.ifStats()
+        for interfaceName, interfaceAddresses in self.ifAddrs().items():
+            if interfaceName in stats and not stats[interfaceName].isup:
+                continue                #  skip interfaces that are down.
             for address in interfaceAddresses:
-                l = []           #  create empty list.
-
-                l.append(interfaceName)
-                l.append(str(address.family))
-
-                l.append(address.address)
-                l.append(address.netmask)
-                l.append(address.broadcast)
-
-                p[n] = l
+                p[n] = (interfaceName, address.family, address.address, address.netmask, address.broadcast)
                 n += 1
 
         return p
 
     # get IO statistics since boot
-    netIO = psutil.net_io_counters()
+    @ttlCache(REFRESH)
+    def netIO(self):
+        return psutil.net_io_counters()
+
+    @property
+    def TotalSentBytes(self):
+        return self.snapshot().TotalSentBytes
 
     @property
     def TotalBytesSent(self):
-        return self.getSize(self.netIO.bytes_sent)
+        value = self.TotalSentBytes
+        return "unavailable" if value is None else self.getSize(value)
+
+    @property
+    def TotalReceivedBytes(self):
+        return self.snapshot().TotalReceivedBytes
 
     @property
     def TotalBytesReceived(self):
-        return self.getSize(self.netIO.bytes_recv)
+        value = self.TotalReceivedBytes
+        return "unavailable" if value is None else self.getSize(value)
       
     # Python information
   
-    @property
+    @functools.cached_property
     def PythonBuild(self):
         return platform.python_build()
       
-    @property
+    @functools.cached_property
     def PythonCompiler(self):
         return platform.python_compiler()
       
-    @property
+    @functools.cached_property
     def PythonBranch(self):
         return platform.python_branch()
       
-    @property
+    @functools.cached_property
     def PythonImplementation(self):
         return platform.python_implementation()
       
-    @property
+    @functools.cached_property
     def PythonRevision(self):
         return platform.python_revision()
       
-    @property
+    @functools.cached_property
     def PythonVersion(self):
         return platform.python_version()
+
+    # Process information
+
+    @ttlCache(REFRESH)
+    def processInfo(self):
+        """  Harvest the process information in one pass.
+
+             Inside oneshot() psutil reads the process details from the OS just the once,
+             rather than once for each value.
+
+             As for harvestCPU, the CPU usage is measured since the previous reading,
+             if that was less than cpuInterval seconds ago, wait out the rest of the interval first.
+        """
+        wait = self.processSampled + self.cpuInterval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+        p = self.process
+        with p.oneshot():
+            info = p.pid, p.name(), p.memory_info().rss, p.num_threads(), p.cpu_percent()
+
+        self.processSampled = time.monotonic()
+        return info
+
+    @property
+    def ProcessID(self):
+        return str(self.processInfo()[0])
+
+    @property
+    def ProcessName(self):
+        return self.processInfo()[1]
+
+    @property
+    def ProcessMemory(self):
+        return self.getSize(self.processInfo()[2])
+
+    @property
+    def ProcessThreads(self):
+        return str(self.processInfo()[3])
+
+    @property
+    def ProcessCPUusage(self):
+        return f"{self.processInfo()[4]}%"